@@ -2,6 +2,12 @@
  * Serverless-friendly PDF to image conversion
  * Uses pdf2pic which works in Railway/serverless environments
  */
+
+// Pages converted concurrently per batch. Each pdf2pic call spawns a
+// GraphicsMagick subprocess, so unbounded Promise.all over a large PDF would
+// launch one process per page inside a memory-constrained handler.
+const MAX_CONCURRENT_PAGES = 2;
+
 export async function convertPDFToImages(pdfBuffer: Buffer): Promise<string[]> {
   try {
     // Use pdf2pic for serverless environments
@@ -11,27 +17,32 @@ export async function convertPDFToImages(pdfBuffer: Buffer): Promise<string[]> {
       density: 150,
       saveFilename: "menu",
       savePath: "/tmp",
-      format: "png",
+      format: "jpeg",
       width: 1200,
       height: 1800,
     });
 
-    const imageBuffers: string[] = [];
-
     // Get page count first
     const pdfLib = await import("pdf-lib");
     const pdfDoc = await pdfLib.PDFDocument.load(pdfBuffer);
     const pageCount = pdfDoc.getPageCount();
 
-    // Convert each page
-    for (let pageNum = 1; pageNum <= pageCount; pageNum++) {
-      const result = await converter(pageNum, { responseType: "base64" });
-      if (result.base64) {
-        imageBuffers.push(`data:image/png;base64,${result.base64}`);
-      }
+    // Convert pages concurrently in fixed-size batches; Promise.all keeps
+    // them in page order within a batch
+    const results = [];
+    for (let start = 1; start <= pageCount; start += MAX_CONCURRENT_PAGES) {
+      const batch = Array.from(
+        { length: Math.min(MAX_CONCURRENT_PAGES, pageCount - start + 1) },
+        (_, i) => start + i
+      );
+      results.push(
+        ...(await Promise.all(batch.map((pageNum) => converter(pageNum, { responseType: "base64" }))))
+      );
     }
 
-    return imageBuffers;
+    return results
+      .filter((result) => result.base64)
+      .map((result) => `data:image/jpeg;base64,${result.base64}`);
   } catch (_error) {
     // Fallback: Return empty array and let Vision work with PDF directly
 
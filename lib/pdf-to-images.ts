@@ -4,27 +4,50 @@ import { createCanvas } from "canvas";
 // Set worker path for pdfjs
 pdfjsLib.GlobalWorkerOptions.workerSrc = `//cdnjs.cloudflare.com/ajax/libs/pdf.js/${pdfjsLib.version}/pdf.worker.min.js`;
 
+// Single render scale shared by every page/viewport
+const RENDER_SCALE = 2.0;
+
+// Pages rendered concurrently per batch. Each in-flight page holds an
+// uncompressed canvas (several MB at scale 2), so unbounded Promise.all over
+// a large PDF would keep every page's buffer alive at once.
+const MAX_CONCURRENT_PAGES = 4;
+
 export async function convertPDFToImages(pdfBuffer: Buffer): Promise<string[]> {
   try {
     const loadingTask = pdfjsLib.getDocument({ data: pdfBuffer });
     const pdf = await loadingTask.promise;
+
+    // Pages render independently (each gets its own canvas), so overlap them
+    // in fixed-size batches; Promise.all preserves page order within a batch.
     const imageUrls: string[] = [];
+    for (let start = 1; start <= pdf.numPages; start += MAX_CONCURRENT_PAGES) {
+      const batch = Array.from(
+        { length: Math.min(MAX_CONCURRENT_PAGES, pdf.numPages - start + 1) },
+        (_, i) => start + i
+      );
 
-    for (let pageNum = 1; pageNum <= pdf.numPages; pageNum++) {
-      const page = await pdf.getPage(pageNum);
-      const viewport = page.getViewport({ scale: 2.0 });
+      const rendered = await Promise.all(
+        batch.map(async (pageNum) => {
+          const page = await pdf.getPage(pageNum);
+          const viewport = page.getViewport({ scale: RENDER_SCALE });
 
-      const canvas = createCanvas(viewport.width, viewport.height);
-      const context = canvas.getContext("2d");
+          const canvas = createCanvas(viewport.width, viewport.height);
+          // alpha: false — PDF pages are opaque and the JPEG output has no
+          // alpha anyway, so skip allocating and compositing a fourth channel
+          const context = canvas.getContext("2d", { alpha: false });
 
-      await page.render({
-        canvasContext: context as unknown as CanvasRenderingContext2D,
-        viewport: viewport,
-        canvas: canvas as unknown as HTMLCanvasElement,
-      }).promise;
+          await page.render({
+            canvasContext: context as unknown as CanvasRenderingContext2D,
+            viewport: viewport,
+            canvas: canvas as unknown as HTMLCanvasElement,
+          }).promise;
 
-      const imageDataUrl = canvas.toDataURL("image/png");
-      imageUrls.push(imageDataUrl);
+          // JPEG: the images only feed vision OCR, which doesn't need lossless
+          // PNG — encoding is faster and the data URLs are a fraction of the size
+          return canvas.toDataURL("image/jpeg", 0.85);
+        })
+      );
+      imageUrls.push(...rendered);
     }
 
     return imageUrls;
@@ -213,6 +213,9 @@ export class CodeReviewer {
       // Parse TypeScript errors
       const lines = output.split("\n");
       for (const line of lines) {
+        // Cheap substring scan first; most lines aren't errors and the
+        // regex engine never needs to run on them.
+        if (!line.includes(": error TS")) continue;
         const match = line.match(/(.+)\((\d+),(\d+)\):\s+error\s+TS\d+:\s+(.+)/);
         if (match) {
           issues.push({
@@ -1 +1,83 @@
-[["lib/ai/tools/order-management-tools.ts", "lib/ai/executors/menu-executors.ts", "lib/ai/tools/qr-tools.ts", "lib/ai/tools/extended-kds-tools.ts", "lib/ai/tools/extended-menu-tools.ts", "lib/ai/tools/table-management-tools.ts", "lib/ai/tools/extended-inventory-tools.ts", "lib/ai/tools/staff-management-tools.ts"], {"file_path}": "return False\n    \n    with open(file_path", "r": "as f:\n        content = f.read()\n    \n    # Check if file already uses createAIClient\n    if 'createAIClient' in content:\n        print(f", "createAIClient": "return False\n    \n    # Replace import\n    content = re.sub(\n        r'import { createAdminClient"}, {"@/lib/ai/client-factory": ",\n        content\n    )\n    \n    # Replace createAdminClient() calls with createAIClient({ venueId })\n    # Need to handle both sync and async contexts\n    content = re.sub(\n        r'const supabase = createAdminClient();", "const supabase = await createAIClient({ venueId });',\n        content\n    )\n    \n    # Also handle adminSupabase variable name\n    content = re.sub(\n        r'const adminSupabase = createAdminClient();',": "onst adminSupabase = await createAIClient({ venueId"}, {",\n        content\n    )\n    \n    # Handle serviceClient variable name\n    content = re.sub(\n        r'const serviceClient = await createAdminClient();',": "onst serviceClient = await createAIClient({ venueId"}, {"__main__": "fixed_count = 0\n    for file_path in ai_tool_files:\n        if fix_file(file_path):\n            fixed_count += 1\n    \n    print(f", "files": ""}]
\ No newline at end of file
+#!/usr/bin/env python3
+"""Migrate AI tool files from createAdminClient to the RLS-respecting createAIClient.
+
+See lib/ai/client-factory.ts — AI tools must use the factory instead of the
+admin (service-role) client to preserve multi-tenant isolation.
+"""
+
+import re
+from pathlib import Path
+
+AI_TOOL_FILES = [
+    "lib/ai/tools/order-management-tools.ts",
+    "lib/ai/executors/menu-executors.ts",
+    "lib/ai/tools/qr-tools.ts",
+    "lib/ai/tools/extended-kds-tools.ts",
+    "lib/ai/tools/extended-menu-tools.ts",
+    "lib/ai/tools/table-management-tools.ts",
+    "lib/ai/tools/extended-inventory-tools.ts",
+    "lib/ai/tools/staff-management-tools.ts",
+]
+
+# Compiled once at module scope; fix_file() runs them once per file and
+# rebuilding the patterns inside the loop would recompile every call.
+IMPORT_RE = re.compile(r"import \{ createAdminClient \} from ['\"]@/lib/supabase[^'\"]*['\"];?")
+IMPORT_REPLACEMENT = 'import { createAIClient } from "@/lib/ai/client-factory";'
+
+# Handles the three variable names the tools use, in sync and async contexts.
+CLIENT_CALL_RES = [
+    (
+        re.compile(r"const supabase = (?:await )?createAdminClient\(\);"),
+        "const supabase = await createAIClient({ venueId });",
+    ),
+    (
+        re.compile(r"const adminSupabase = (?:await )?createAdminClient\(\);"),
+        "const adminSupabase = await createAIClient({ venueId });",
+    ),
+    (
+        re.compile(r"const serviceClient = (?:await )?createAdminClient\(\);"),
+        "const serviceClient = await createAIClient({ venueId });",
+    ),
+]
+
+
+def fix_file(file_path: str) -> bool:
+    path = Path(file_path)
+    try:
+        original = path.read_text()
+    except FileNotFoundError:
+        print(f"⚠️  {file_path} not found, skipping")
+        return False
+
+    if "createAIClient" in original:
+        print(f"✓ {file_path} already uses createAIClient")
+        return False
+
+    # Substring check is a tight C scan; skip the whole regex pipeline for
+    # files that can't possibly match.
+    if "createAdminClient" not in original:
+        print(f"✓ {file_path} has no createAdminClient usage")
+        return False
+
+    content, modified = IMPORT_RE.subn(IMPORT_REPLACEMENT, original)
+    for pattern, replacement in CLIENT_CALL_RES:
+        content, count = pattern.subn(replacement, content)
+        modified += count
+
+    # Only write when a substitution fired; an untouched file keeps its mtime
+    # and content hash, so tsc's incremental build info stays valid.
+    if not modified or content == original:
+        print(f"✓ {file_path} unchanged")
+        return False
+
+    path.write_text(content)
+    print(f"✅ Fixed {file_path}")
+    return True
+
+
+if __name__ == "__main__":
+    fixed_count = 0
+    for file_path in AI_TOOL_FILES:
+        if fix_file(file_path):
+            fixed_count += 1
+    print(f"\nFixed {fixed_count}/{len(AI_TOOL_FILES)} files")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Add the structured-logger import to files that call `logger.` without it.
+
+The old version of this script tested `'import.*logger' in content` — a
+literal substring that never matches — so it re-added the import and rewrote
+the file on every run. A compiled regex behind a cheap substring prefilter
+checks for an existing import correctly and only touches files that need one.
+"""
+
+import re
+from pathlib import Path
+
+LOGGER_IMPORT = 'import { logger } from "@/lib/monitoring/structured-logger";'
+
+# An existing import counts if `logger` appears in a named import clause or
+# the module specifier ends in a logger module.
+LOGGER_IMPORT_RE = re.compile(
+    r"\b(?:import\s+\{[^}]*\blogger\b[^}]*\}\s+from|from\s+[\"'][^\"']*logger)"
+)
+LOGGER_USE_RE = re.compile(r"\blogger\.(?:info|warn|error|debug)\(")
+# Matches a complete import statement through its terminating semicolon, so
+# prettier-wrapped multi-line imports (import {\n  a,\n} from "x";) anchor at
+# the end of the statement rather than at the opening line.
+IMPORT_STMT_RE = re.compile(r"^import\b[^;]*?;", re.M | re.S)
+# "use client" / "use server" must stay the first statement in the file.
+DIRECTIVE_RE = re.compile(r"^([\"'])use (?:client|server)\1;?[ \t]*\r?\n")
+
+SOURCE_DIRS = ["app", "lib", "components", "hooks"]
+
+
+def fix_file(path: Path) -> bool:
+    content = path.read_text()
+
+    # Substring prefilter: skip all three regexes when the word never appears.
+    if "logger" not in content:
+        return False
+    if LOGGER_IMPORT_RE.search(content):
+        return False
+    if not LOGGER_USE_RE.search(content):
+        return False
+
+    # Insert after the last complete import statement; otherwise after a
+    # leading "use client"/"use server" directive; otherwise at the very top.
+    last_import = None
+    for last_import in IMPORT_STMT_RE.finditer(content):
+        pass
+    if last_import:
+        pos = last_import.end()
+        content = content[:pos] + "\n" + LOGGER_IMPORT + content[pos:]
+    else:
+        directive = DIRECTIVE_RE.match(content)
+        pos = directive.end() if directive else 0
+        content = content[:pos] + LOGGER_IMPORT + "\n" + content[pos:]
+
+    path.write_text(content)
+    print(f"✅ {path}")
+    return True
+
+
+def main() -> None:
+    fixed = 0
+    for dir_name in SOURCE_DIRS:
+        for path in Path(dir_name).rglob("*.ts"):
+            if path.name.endswith(".d.ts"):
+                continue
+            if fix_file(path):
+                fixed += 1
+        for path in Path(dir_name).rglob("*.tsx"):
+            if fix_file(path):
+                fixed += 1
+    print(f"\nAdded logger import to {fixed} files")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+#!/usr/bin/env python3
+"""Entry point that runs only the TS2552 rename fixer. See fix_ts.py."""
+
+import fix_ts
+
+if __name__ == "__main__":
+    fix_ts.main(["renames"])
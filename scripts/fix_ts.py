@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""One-shot orchestrator for the TypeScript fix codemods.
+
+The individual fix-* scripts each ran tsc, parsed its output and rewrote files
+on their own; chained together that duplicated the expensive parts once per
+script. This module runs tsc once (via the shared cache), parses the output
+once, and dispatches every error to its fixer, so each affected file is read
+and written exactly once no matter how many error kinds hit it.
+
+Run all fixers with `python scripts/fix_ts.py`, or a subset by name:
+`python scripts/fix_ts.py property-access`.
+"""
+
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from shared import load_tsc_errors
+
+# ─── Property access: TS2339/TS2551 → (x as any).prop ───────────────────────
+
+
+# Compiled alternations keyed by property set, mirroring _RENAME_PATTERN_CACHE
+# below: the same flagged properties recur across many lines, and re.compile's
+# internal LRU (~512 entries) thrashes at real-world error volumes.
+_CAST_PATTERN_CACHE: dict = {}
+
+
+def _cast_pattern(props: frozenset) -> re.Pattern:
+    pat = _CAST_PATTERN_CACHE.get(props)
+    if pat is None:
+        pat = re.compile(
+            r"\b([A-Za-z_]\w*)\s*\.\s*(" + "|".join(map(re.escape, sorted(props))) + r")\b"
+        )
+        _CAST_PATTERN_CACHE[props] = pat
+    return pat
+
+
+def cast_properties(line: str, props: list) -> str:
+    combined = _cast_pattern(frozenset(props))
+
+    def cast(m: re.Match) -> str:
+        if m.group(1) == "any":  # receiver already wrapped in (x as any)
+            return m.group(0)
+        return f"({m.group(1)} as any).{m.group(2)}"
+
+    return combined.sub(cast, line)
+
+
+# ─── Renames: TS2552 → tsc's own suggestion ─────────────────────────────────
+
+# Compiled alternations keyed by rename set: the same handful of renames
+# (e.g. {_error: error}) recurs across many lines, so each distinct set is
+# compiled exactly once.
+_RENAME_PATTERN_CACHE: dict = {}
+
+
+def _rename_pattern(names: frozenset) -> re.Pattern:
+    pat = _RENAME_PATTERN_CACHE.get(names)
+    if pat is None:
+        # (?!:) keeps object-literal keys like `error:` untouched.
+        pat = re.compile(r"\b(" + "|".join(map(re.escape, sorted(names))) + r")\b(?!:)")
+        _RENAME_PATTERN_CACHE[names] = pat
+    return pat
+
+
+def apply_renames(line: str, pairs: list) -> str:
+    renames = dict(pairs)
+    pat = _rename_pattern(frozenset(renames))
+    return pat.sub(lambda m: renames[m.group(1)], line)
+
+
+# Optional: AST-aware renames. The \b-regex fallback can touch identifier-like
+# text inside strings and comments; a tree-sitter parse yields exact identifier
+# node ranges in one C-speed pass. Used automatically when the bindings are
+# installed (pip install tree-sitter tree-sitter-typescript).
+try:
+    import tree_sitter_typescript
+    from tree_sitter import Language, Parser
+
+    _TS_LANGUAGE = Language(tree_sitter_typescript.language_typescript())
+    _TSX_LANGUAGE = Language(tree_sitter_typescript.language_tsx())
+except ImportError:
+    _TS_LANGUAGE = _TSX_LANGUAGE = None
+
+
+def apply_renames_ast(content: str, renames_by_line: dict, tsx: bool = False) -> str:
+    """Rename identifiers using node ranges from a tree-sitter parse.
+
+    ``renames_by_line`` maps 0-based line index -> {old name: new name}; only
+    identifiers on those lines are touched. Property keys parse as
+    property_identifier nodes, so keys like `error:` are skipped for free.
+    """
+    data = content.encode()
+    parser = Parser(_TSX_LANGUAGE if tsx else _TS_LANGUAGE)
+    tree = parser.parse(data)
+
+    edits = []
+    stack = [tree.root_node]
+    while stack:
+        node = stack.pop()
+        if node.type == "identifier":
+            line_renames = renames_by_line.get(node.start_point[0])
+            if line_renames:
+                new = line_renames.get(data[node.start_byte : node.end_byte].decode())
+                if new:
+                    edits.append((node.start_byte, node.end_byte, new))
+        else:
+            stack.extend(node.children)
+
+    # Apply byte-range replacements back to front so earlier offsets stay valid.
+    for start, end, new in sorted(edits, reverse=True):
+        data = data[:start] + new.encode() + data[end:]
+    return data.decode()
+
+
+# ─── Dispatch table ─────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class Fixer:
+    name: str
+    group: str  # named group in shared.TS_ERR_RE that selects this fixer
+    payload: Callable  # match -> payload for one error
+    fix_line: Callable  # (line, payloads) -> fixed line
+
+
+FIXERS = (
+    Fixer("property-access", "prop", lambda m: m["prop"], cast_properties),
+    Fixer("renames", "name", lambda m: (m["name"], m["suggestion"]), apply_renames),
+)
+
+
+def collect_fixes(errors: list, fixers: tuple = FIXERS) -> dict:
+    """Map file path -> {0-based line index -> {fixer name -> payload list}}.
+
+    ``errors`` are the record dicts from shared.load_tsc_errors().
+    """
+    fixes: dict = {}
+    for m in errors:
+        for fixer in fixers:
+            if m[fixer.group]:
+                per_line = fixes.setdefault(m["file"], {})
+                per_line.setdefault(int(m["ln"]) - 1, {}).setdefault(fixer.name, []).append(
+                    fixer.payload(m)
+                )
+                break
+    return fixes
+
+
+def fix_one_file(file_path: str, edits_per_line: dict) -> int:
+    path = Path(file_path)
+    # EAFP: reading directly costs one stat instead of exists() + read.
+    try:
+        original = path.read_text()
+    except FileNotFoundError:
+        return 0
+    # keepends=True: line terminators stay attached, so rejoining is a plain
+    # "".join and original endings (including CRLF) survive untouched.
+    lines = original.splitlines(keepends=True)
+
+    fixed = 0
+    ast_renames: dict = {}
+    for idx, by_fixer in edits_per_line.items():
+        if idx >= len(lines):
+            continue
+        line = lines[idx]
+        for fixer in FIXERS:
+            payloads = by_fixer.get(fixer.name)
+            if not payloads:
+                continue
+            if fixer.name == "renames" and _TS_LANGUAGE is not None:
+                # Deferred to a single AST pass over the whole file below.
+                ast_renames[idx] = dict(payloads)
+                continue
+            line = fixer.fix_line(line, payloads)
+        if line != lines[idx]:
+            lines[idx] = line
+            fixed += 1
+
+    new_content = "".join(lines) if fixed else original
+    if ast_renames:
+        renamed = apply_renames_ast(new_content, ast_renames, tsx=file_path.endswith(".tsx"))
+        if renamed != new_content:
+            new_content = renamed
+            fixed += len(ast_renames)
+
+    if new_content != original:
+        path.write_text(new_content)
+    return fixed
+
+
+def main(only: list = None) -> None:
+    fixers = FIXERS if not only else tuple(f for f in FIXERS if f.name in only)
+    fixes = collect_fixes(load_tsc_errors(), fixers)
+    if not fixes:
+        print("No fixable errors found")
+        return
+
+    # Each file is read, rewritten and written independently, so the fix phase
+    # fans out across cores. Processes rather than threads: the work is
+    # regex-heavy and holds the GIL.
+    total = 0
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        results = ex.map(fix_one_file, fixes.keys(), fixes.values(), chunksize=8)
+        for file_path, count in zip(fixes.keys(), results):
+            if count:
+                print(f"✅ {file_path}: {count} lines fixed")
+                total += count
+    print(f"\nFixed {total} lines across {len(fixes)} files")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or None)
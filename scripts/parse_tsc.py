@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""Refresh .tsc-errors.json from the cached tsc output.
+
+Standalone entry point for shared.load_tsc_errors(); run it once up front so
+every downstream fix script starts from the pre-parsed JSON.
+"""
+
+from shared import load_tsc_errors
+
+if __name__ == "__main__":
+    errors = load_tsc_errors()
+    print(f"Parsed {len(errors)} tsc errors into .tsc-errors.json")
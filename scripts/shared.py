@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Shared helpers for the TypeScript fix scripts in scripts/.
+
+The fix scripts all need the current `tsc --noEmit` error output. Running the
+compiler is by far their dominant cost, so the output is cached on disk and
+reused when several scripts run back to back.
+"""
+
+import json
+import mmap
+import re
+import subprocess
+import time
+from pathlib import Path
+
+TSC_CACHE_FILE = Path(".tsc-cache.txt")
+TSC_ERRORS_FILE = Path(".tsc-errors.json")
+TS_BUILD_INFO_FILE = Path(".tsbuildinfo")
+
+# One combined pattern recognizes every error shape the fix scripts handle, so
+# the output blob is scanned once (via finditer) instead of line-by-line with
+# one re.search per error code. Callers dispatch on which named group matched.
+TS_ERR_RE = re.compile(
+    r"^(?P<file>.+?)\((?P<ln>\d+),\d+\): error "
+    r"(?:TS(?:2339|2551): Property '(?P<prop>\w+)' does not exist"
+    r"|TS2552: Cannot find name '(?P<name>\w+)'\. Did you mean '(?P<suggestion>\w+)'\?)",
+    re.M,
+)
+
+
+# Bytes twin of TS_ERR_RE for scanning the memory-mapped cache file directly.
+TS_ERR_RE_BYTES = re.compile(TS_ERR_RE.pattern.encode(), re.M)
+
+
+def iter_ts_errors(output: str):
+    """Yield a match object for every recognized tsc error in ``output``."""
+    return TS_ERR_RE.finditer(output)
+
+
+def parse_tsc_cache_file() -> list:
+    """Parse .tsc-cache.txt into record dicts, scanning it via mmap.
+
+    The mapped file is matched in place with the bytes pattern, so a
+    multi-megabyte error log never lands on the Python heap — only the
+    matched fragments are decoded.
+    """
+    with open(TSC_CACHE_FILE, "rb") as f:
+        if f.seek(0, 2) == 0:  # an empty file cannot be mapped
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return [
+                {k: v.decode() if v is not None else None for k, v in m.groupdict().items()}
+                for m in TS_ERR_RE_BYTES.finditer(mm)
+            ]
+
+
+def load_tsc_errors() -> list:
+    """Parsed tsc errors, persisted in .tsc-errors.json.
+
+    The JSON is reused while it is at least as new as .tsc-cache.txt, so a
+    chain of fix scripts parses each compiler run exactly once; the first
+    script after a fresh run pays for the parse, the rest just json.load.
+    """
+    ensure_tsc_cache()
+    try:
+        if TSC_ERRORS_FILE.stat().st_mtime >= TSC_CACHE_FILE.stat().st_mtime:
+            return json.loads(TSC_ERRORS_FILE.read_text())
+    except (FileNotFoundError, ValueError):
+        pass  # no JSON yet, or a torn write — re-parse below
+
+    errors = parse_tsc_cache_file()
+    TSC_ERRORS_FILE.write_text(json.dumps(errors))
+    return errors
+
+
+def ensure_tsc_cache(max_age_s: int = 30) -> Path:
+    """Make sure .tsc-cache.txt is fresh, running tsc if it isn't.
+
+    A cache file younger than ``max_age_s`` seconds is reused as-is, so a chain
+    of fix scripts pays for one typecheck instead of one each. The compiler is
+    invoked with --incremental so tsc itself also reuses type information from
+    the previous run via .tsbuildinfo.
+    """
+    try:
+        if time.time() - TSC_CACHE_FILE.stat().st_mtime < max_age_s:
+            return TSC_CACHE_FILE
+    except FileNotFoundError:
+        pass  # no cache yet — fall through to a cold run
+
+    # Stream rather than capture_output: on broken builds tsc can emit
+    # megabytes of errors, and Popen lets us drain them line-by-line while the
+    # compiler is still running instead of buffering two full copies.
+    # --pretty false drops ANSI color codes from the output.
+    proc = subprocess.Popen(
+        [
+            "npx",
+            "tsc",
+            "--noEmit",
+            "--pretty",
+            "false",
+            "--incremental",
+            "--tsBuildInfoFile",
+            str(TS_BUILD_INFO_FILE),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+    # Spool straight to the cache file as lines arrive; the output never needs
+    # to be held in memory here — consumers mmap the file to parse it.
+    with TSC_CACHE_FILE.open("w") as cache:
+        for line in proc.stdout:
+            cache.write(line)
+    proc.wait(timeout=60)
+    return TSC_CACHE_FILE
+
+
+def get_tsc_output(max_age_s: int = 30) -> str:
+    """Return the (cached) output of `npx tsc --noEmit` as a string."""
+    return ensure_tsc_cache(max_age_s).read_text()